@@ -0,0 +1,39 @@
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    pyrodash: {
+
+        // Patches the camera straight into the figure so dragging the
+        // scene never triggers a Python round-trip.
+        update_camera: function (relayoutData, figure) {
+            if (!figure || !relayoutData || !relayoutData["scene.camera"]) {
+                return window.dash_clientside.no_update;
+            }
+            const layout = {...figure.layout};
+            layout.scene = {...layout.scene, camera: relayoutData["scene.camera"]};
+            return {...figure, layout: layout};
+        },
+
+        // Applies the projection radio without rebuilding the traces,
+        // mirroring the aspect-ratio rules of build_figure.
+        update_projection: function (projection, figure, cube, tetraCount, whichTetras) {
+            if (!figure) {
+                return window.dash_clientside.no_update;
+            }
+            const scene = {...figure.layout.scene};
+            scene.camera = {...scene.camera};
+            if (projection === "ps") {
+                scene.camera.projection = {type: "perspective"};
+                delete scene.aspectmode;
+                delete scene.aspectratio;
+            } else {
+                scene.camera.projection = {type: "orthographic"};
+                scene.aspectmode = "manual";
+                let z = 1.5;
+                if (cube === "n" && tetraCount === 2) {
+                    z = (whichTetras === "u" || whichTetras === "d") ? 0.5 : 0.75;
+                }
+                scene.aspectratio = {x: 1.5, y: 1.5, z: z};
+            }
+            return {...figure, layout: {...figure.layout, scene: scene}};
+        },
+    },
+});
@@ -1,8 +1,12 @@
+import math
+from functools import cached_property
+
 import numpy as np
 
 from pyrodash.geometrics import Cylinder
 from pyrodash.geometrics import Cone
 from pyrodash.geometrics import Circle
+from pyrodash.geometrics._meshcache import angle_tables
 import pyrodash.utils.linalg as linalg
 
 
@@ -36,7 +40,7 @@ class Arrow:
     base_cone : Circle object.
         instance of the Circle class for the cone base.
     surface : list of plotly go
-        plotly objects of the drawn arrow.
+        plotly objects of the drawn arrow, built lazily on first access.
     """
 
     def __init__(
@@ -49,7 +53,8 @@ class Arrow:
         cone_cylinder_radius_ratio=1.8,
         pivot="mid",
         surface_color="#636efa",
-        mesh_size=50,
+        mesh_size=20,
+        axis_is_unit=False,
     ):
         """
         Parameters
@@ -74,14 +79,22 @@ class Arrow:
             surface color, by default "#636efa".
         mesh_size : integer, optional
             size `n` of the `n x n` mesh generated to calculate the
-            coordinates of the surface, by default 50.
+            coordinates of the surface, by default 20.
+        axis_is_unit : bool, optional
+            whether the axis is already normalized, in which case the
+            normalization is skipped, by default False.
         """
 
-        self.pos = np.array(pos)
+        self.pos = np.asarray(pos, dtype=np.float64)
         self.radius = radius
 
         self.length = length
-        self.axis = np.array(axis) / np.linalg.norm(np.array(axis))
+
+        if axis_is_unit:
+            self.axis = np.asarray(axis)
+        else:
+            axis = np.asarray(axis, dtype=np.float64)
+            self.axis = axis / math.sqrt(axis @ axis)
 
         cylinder_radius = self.radius
         cylinder_length = (1 - cone_length_ratio) * self.length
@@ -98,15 +111,19 @@ class Arrow:
             self.pivot = pivot
 
         if self.pivot == "tail":
-            cylinder_center = np.array(pos) + 0.5 * cylinder_length * self.axis
+            cylinder_center = self.pos + 0.5 * cylinder_length * self.axis
         elif self.pivot == "mid":
-            cylinder_center = np.array(pos) - 0.5 * cone_length * self.axis
+            cylinder_center = self.pos - 0.5 * cone_length * self.axis
         elif self.pivot == "tip":
             cylinder_center = (
-                np.array(pos) - (cone_length + 0.5 * cylinder_length) * self.axis
+                self.pos - (cone_length + 0.5 * cylinder_length) * self.axis
             )
 
-        n1, n2 = linalg.perpendicular_plane_vectors(self.axis)
+        n1, n2 = linalg.cached_perpendicular_plane_vectors(self.axis)
+
+        # The cylinder, cone and both bases share the same parametric
+        # angles; the sin/cos tables are cached per mesh size.
+        trig = angle_tables(mesh_size)
 
         self.cylinder = Cylinder(
             cylinder_center,
@@ -117,9 +134,16 @@ class Arrow:
             n2,
             surface_color,
             mesh_size,
+            trig,
         )
         self.base_cylinder = Circle(
-            self.cylinder.base_center, cylinder_radius, self.axis, n1, n2, surface_color
+            self.cylinder.base_center,
+            cylinder_radius,
+            self.axis,
+            n1,
+            n2,
+            surface_color,
+            trig,
         )
 
         self.cone = Cone(
@@ -131,17 +155,29 @@ class Arrow:
             n2,
             surface_color,
             mesh_size,
+            trig,
         )
         self.base_cone = Circle(
-            self.cone.base_center, cone_base_radius, self.axis, n1, n2, surface_color
+            self.cone.base_center,
+            cone_base_radius,
+            self.axis,
+            n1,
+            n2,
+            surface_color,
+            trig,
         )
 
-        self.surface = (
-            self.cylinder.surface
-            + self.base_cylinder.scatter
-            + self.cone.surface
-            + self.base_cone.scatter
-        )
+    @cached_property
+    def surface(self):
+        """list of plotly go: plotly objects of the drawn arrow, built
+        on first access and cached along with the parts' own traces."""
+
+        return [
+            self.cylinder.surface,
+            self.base_cylinder.mesh,
+            self.cone.surface,
+            self.base_cone.mesh,
+        ]
 
 
 if __name__ == "__main__":
@@ -1,6 +1,17 @@
 from pyrodash.geometrics import Sphere
 
 
+# Radius and color of the drawn sphere for each possible charge: Spin
+# Ice (no monopole), simple monopole and double monopole.
+_CHARGE_STYLES = {
+    0: (0, "black"),
+    +2: (0.052, "#02590f"),
+    -2: (0.052, "#be0119"),
+    +4: (0.07, "#01ff07"),
+    -4: (0.07, "red"),
+}
+
+
 class Monopole(Sphere):
     """
     Class to represent and draw the monopoles according to its charges.
@@ -14,16 +25,21 @@ class Monopole(Sphere):
     ----------
     charge : int
         charge of the monopole.
+    color : str
+        color string of the drawn sphere.
     center : numpy array
         x, y, z coordinates of the center.
     radius : float
         radius of the sphere.
     x, y, z : numpy array
         coordinates of the surface of the sphere.
-    surface : list with a plotly go
-        surface plotly object of the drawn sphere.
+    surface : plotly go
+        surface plotly object of the drawn sphere, built lazily on
+        first access.
     """
 
+    __slots__ = ("charge", "color")
+
     def __init__(self, charge, center):
         """
         Parameters
@@ -36,23 +52,9 @@ class Monopole(Sphere):
 
         self.charge = charge
 
-        # Spin Ice
-        if self.charge == 0:
-            super().__init__(center, 0, surface_color="black")
-
-        # Simple monopole
-        elif self.charge == +2:
-            super().__init__(center, 0.052, surface_color="#02590f")
-
-        elif self.charge == -2:
-            super().__init__(center, 0.052, surface_color="#be0119")
-
-        # Double monopole
-        elif self.charge == +4:
-            super().__init__(center, 0.07, surface_color="#01ff07")
+        radius, self.color = _CHARGE_STYLES[charge]
 
-        elif self.charge == -4:
-            super().__init__(center, 0.07, surface_color="red")
+        super().__init__(center, radius, surface_color=self.color)
 
 
 if __name__ == "__main__":
@@ -65,7 +67,7 @@ if __name__ == "__main__":
 
     m = Monopole(int(sum([1, 1, -1, 1])), [0, 0, 0])
 
-    fig = go.Figure(data=m.surface)
+    fig = go.Figure(data=[m.surface])
 
     external_stylesheets = ["https://codepen.io/chriddyp/pen/bWLwgP.css"]
 
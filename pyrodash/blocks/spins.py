@@ -1,8 +1,16 @@
+from functools import cached_property
+
 import numpy as np
 
 from pyrodash.blocks import Arrow
 
 
+# Arrows cached by position and spin sign. A flipped spin only negates
+# the axis and swaps the color, so each site needs at most two arrows
+# ever; reconfigurations reuse them instead of regenerating the meshes.
+_arrow_cache = {}
+
+
 class Spins:
     """
     Class to build and draw the spins of an Up Tetrahedron.
@@ -30,14 +38,14 @@ class Spins:
     arrows : list of Arrow object
         contains instances of the Arrow class to use as spins.
     surfaces : list of plotly go
-        plotly objects of the drawn spins.
+        plotly objects of the drawn spins, built lazily on first access.
     """
 
     base_spin_axes = np.array(
         [[1, 1, 1], [1, -1, -1], [-1, -1, 1], [-1, 1, -1]]
     ) / np.sqrt(3)
 
-    def __init__(self, positions, s1234):
+    def __init__(self, positions, s1234, mesh_size=20):
         """
         Parameters
         ----------
@@ -46,25 +54,47 @@ class Spins:
             position.
         s1234 : list of int or numpy array
             spin values.
+        mesh_size : integer, optional
+            size `n` of the `n x n` mesh generated to calculate the
+            coordinates of the arrow surfaces, by default 20.
         """
 
         self.positions = positions
 
-        if not all(s == 1 or s == -1 for s in s1234):
+        s1234 = np.asarray(s1234, dtype=np.int8)
+        if not np.all(np.abs(s1234) == 1):
             raise ValueError("spin values must be 1 or -1")
         else:
-            self.s1234 = np.array(s1234)
-
-        self.axes = np.diag(self.s1234) @ Spins.base_spin_axes
-
-        self.colors = ["blue" if s == 1 else "black" for s in self.s1234]
-
-        self.arrows = [
-            Arrow(pos, 0.013, 0.22, axis, surface_color=color)
-            for pos, axis, color in zip(self.positions, self.axes, self.colors)
-        ]
-
-        self.surfaces = [surface for arrow in self.arrows for surface in arrow.surface]
+            self.s1234 = s1234
+
+        self.axes = self.s1234[:, None] * Spins.base_spin_axes
+
+        self.colors = np.where(self.s1234 == 1, "blue", "black").tolist()
+
+        self.arrows = []
+        for pos, s, axis, color in zip(
+            self.positions, self.s1234, self.axes, self.colors
+        ):
+            key = (tuple(pos), int(s), mesh_size)
+            arrow = _arrow_cache.get(key)
+            if arrow is None:
+                arrow = _arrow_cache[key] = Arrow(
+                    pos,
+                    0.013,
+                    0.22,
+                    axis,
+                    surface_color=color,
+                    mesh_size=mesh_size,
+                    axis_is_unit=True,
+                )
+            self.arrows.append(arrow)
+
+    @cached_property
+    def surfaces(self):
+        """list of plotly go: plotly objects of the drawn spins, built
+        on first access and cached."""
+
+        return [surface for arrow in self.arrows for surface in arrow.surface]
 
 
 if __name__ == "__main__":
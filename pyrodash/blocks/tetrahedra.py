@@ -1,3 +1,5 @@
+from functools import cached_property
+
 import numpy as np
 import plotly.graph_objects as go
 
@@ -11,6 +13,9 @@ class Tetrahedra:
 
     Attributes
     ----------
+    base_vertices : numpy array
+        class attribute with the positions of the vertices of an Up
+        Tetrahedron with respect to its center, for a unit side.
     center_up : numpy array
         x, y, z coordinates of the center of the Up Tetrahedron.
     L : float
@@ -19,12 +24,16 @@ class Tetrahedra:
     up_vertices, down_vertices : numpy array
         vertices coordinates of the Up and Down Tetrahedra.
     up_faces, down_faces : list of plotly go
-        mesh3d plotly objects of the faces of the Up and Down Tetrahedra.
+        mesh3d plotly objects of the faces of the Up and Down Tetrahedra,
+        built lazily on first access.
     site_numbers : plotly go
-        scatter 3d plotly object without markers, to number the sites.
+        scatter 3d plotly object without markers, to number the sites,
+        built lazily on first access.
     """
 
-    def __init__(self, center_up, L=0.25, init_count=1, N=1):
+    base_vertices = np.array([[1, 1, 1], [1, -1, -1], [-1, -1, 1], [-1, 1, -1]]) / 2
+
+    def __init__(self, center_up, L=0.25, init_count=1, N=1, precomputed_vertices=None):
         """
         Parameters
         ----------
@@ -38,22 +47,61 @@ class Tetrahedra:
         N : integer, optional
             related to the opacity of the faces: the higher N is, the more
             transparent the faces will be, by default 1.
+        precomputed_vertices : numpy array, optional
+            (4, 3) vertices of the Up Tetrahedron, already computed by
+            the caller (e.g. batched over a whole cell), in which case
+            the vertex calculation is skipped, by default None.
         """
 
-        self.center_up = np.array(center_up)
+        self.center_up = np.asarray(center_up, dtype=np.float64)
         self.L = L
 
-        self.up_vertices, self.down_vertices = self._vertices_calculation()
-        self.up_faces, self.down_faces = self._draw_faces(N)
-        self.site_numbers = self._sites(init_count)
+        self.up_vertices, self.down_vertices = self._vertices_calculation(
+            precomputed_vertices
+        )
+        self._N = N
+        self._init_count = init_count
+
+    @cached_property
+    def _face_traces(self):
+        """tuple of list of plotly go: cached (up_faces, down_faces)
+        pair, built on first access of either."""
+
+        return self._draw_faces(self._N)
+
+    @property
+    def up_faces(self):
+        """list of plotly go: faces of the Up Tetrahedron."""
+
+        return self._face_traces[0]
+
+    @property
+    def down_faces(self):
+        """list of plotly go: faces of the Down Tetrahedron."""
 
-    def _vertices_calculation(self):
+        return self._face_traces[1]
+
+    @cached_property
+    def site_numbers(self):
+        """plotly go: scatter 3d without markers, to number the sites,
+        built on first access and cached."""
+
+        return self._sites(self._init_count)
+
+    def _vertices_calculation(self, up_vertices=None):
         """Calculates the vertices coordinates of the Tetrahedra.
 
         It is done by adding to 'center_up' the positions of the vertices
-        of the Up Tetrahedron with respect to its center. The Down
-        Tetrahedron vertices are calculated by inverting the values of the
-        vertices and moving them.
+        of the Up Tetrahedron with respect to its center, unless they
+        were already precomputed by the caller. The Down Tetrahedron
+        vertices are calculated by inverting the values of the vertices
+        and moving them.
+
+        Parameters
+        ----------
+        up_vertices : numpy array, optional
+            precomputed (4, 3) vertices of the Up Tetrahedron, by
+            default None.
 
         Returns
         -------
@@ -61,9 +109,8 @@ class Tetrahedra:
             vertices coordinates of the Up and Down Tetrahedra.
         """
 
-        up_vertices = self.center_up + self.L / 2 * np.array(
-            [[1, 1, 1], [1, -1, -1], [-1, -1, 1], [-1, 1, -1]]
-        )
+        if up_vertices is None:
+            up_vertices = self.center_up + self.L * Tetrahedra.base_vertices
 
         down_vertices = -up_vertices + 2 * up_vertices[0]
 
@@ -72,8 +119,10 @@ class Tetrahedra:
     def _draw_faces(self, N):
         """Generates the plotly 3d meshes for the faces of the Tetrahedra.
 
-        It uses the vertices of the Tetrahedra to build the mesh for each
-        face and then add it to the corresponding list.
+        Each tetrahedron is a single mesh with the four faces sharing
+        its vertex buffer and the per-face opacity baked into rgba face
+        colors, plus one scatter with all the face edges, instead of
+        two traces per face.
 
         Parameters
         ----------
@@ -84,69 +133,63 @@ class Tetrahedra:
         Returns
         -------
         up_faces, down_faces : list of plotly go
-            mesh3d plotly objects of the faces of the Up and Down
-            Tetrahedra.
+            mesh3d plotly object of the faces of the Up and Down
+            Tetrahedra, plus the scatter 3d of their edges.
         """
 
-        up_faces = []
-        down_faces = []
-
-        for i, face in enumerate([(0, 1, 2), (0, 2, 3), (0, 3, 1), (1, 2, 3)]):
-            up_faces.extend(
-                [
-                    go.Mesh3d(
-                        x=self.up_vertices[:, 0],
-                        y=self.up_vertices[:, 1],
-                        z=self.up_vertices[:, 2],
-                        i=[face[0]],
-                        j=[face[1]],
-                        k=[face[2]],
-                        opacity=(0.35 - i * 0.07) / np.cbrt(N),
-                        facecolor=["mediumpurple"],
-                        hoverinfo="none",
-                        showscale=False,
-                    ),
-                    go.Scatter3d(
-                        x=self.up_vertices[face, 0],
-                        y=self.up_vertices[face, 1],
-                        z=self.up_vertices[face, 2],
-                        mode="lines",
-                        line=dict(color="black", width=1),
-                        opacity=0.1 / np.cbrt(N),
-                        hoverinfo="none",
-                        showlegend=False,
-                    ),
-                ]
+        faces = [(0, 1, 2), (0, 2, 3), (0, 3, 1), (1, 2, 3)]
+        i, j, k = zip(*faces)
+
+        inv_cbrt_n = 1 / np.cbrt(N)
+
+        traces = []
+        for vertices, rgb in (
+            (self.up_vertices, "147, 112, 219"),  # mediumpurple
+            (self.down_vertices, "135, 206, 250"),  # lightskyblue
+        ):
+
+            facecolor = [
+                f"rgba({rgb}, {(0.35 - n * 0.07) * inv_cbrt_n:.3f})"
+                for n in range(len(faces))
+            ]
+
+            mesh = go.Mesh3d(
+                x=vertices[:, 0],
+                y=vertices[:, 1],
+                z=vertices[:, 2],
+                i=i,
+                j=j,
+                k=k,
+                facecolor=facecolor,
+                hoverinfo="none",
+                showscale=False,
             )
 
-            down_faces.extend(
-                [
-                    go.Mesh3d(
-                        x=self.down_vertices[:, 0],
-                        y=self.down_vertices[:, 1],
-                        z=self.down_vertices[:, 2],
-                        i=[face[0]],
-                        j=[face[1]],
-                        k=[face[2]],
-                        opacity=(0.35 - i * 0.07) / np.cbrt(N),
-                        facecolor=["lightskyblue"],
-                        hoverinfo="none",
-                        showscale=False,
-                    ),
-                    go.Scatter3d(
-                        x=self.down_vertices[face, 0],
-                        y=self.down_vertices[face, 1],
-                        z=self.down_vertices[face, 2],
-                        mode="lines",
-                        line=dict(color="black", width=1),
-                        opacity=0.1 / np.cbrt(N),
-                        hoverinfo="none",
-                        showlegend=False,
-                    ),
-                ]
+            # All the edges in one scatter, with None separators
+            # between the faces.
+            edge_x, edge_y, edge_z = [], [], []
+            for face in faces:
+                edge_x.extend(vertices[face, 0])
+                edge_y.extend(vertices[face, 1])
+                edge_z.extend(vertices[face, 2])
+                edge_x.append(None)
+                edge_y.append(None)
+                edge_z.append(None)
+
+            edges = go.Scatter3d(
+                x=edge_x,
+                y=edge_y,
+                z=edge_z,
+                mode="lines",
+                line=dict(color="black", width=1),
+                opacity=0.1 * inv_cbrt_n,
+                hoverinfo="none",
+                showlegend=False,
             )
 
-        return up_faces, down_faces
+            traces.append([mesh, edges])
+
+        return traces[0], traces[1]
 
     def _sites(self, initial_spin):
         """Generates a Scatter 3d object without markers.
@@ -174,7 +217,7 @@ class Tetrahedra:
             marker_color="mediumpurple",
             opacity=0,
             hoverinfo="text",
-            hovertext=[initial_spin + i for i in range(4)],
+            hovertext=np.arange(initial_spin, initial_spin + 4),
             hoverlabel_font=dict(family="serif", size=20, color="white"),
             showlegend=False,
         )
@@ -1,5 +1,6 @@
+import functools
+
 import numpy as np
-import pandas as pd
 from pathlib import Path
 
 from pyrodash.geometrics.parallelepiped import Parallelepiped
@@ -8,6 +9,27 @@ from pyrodash.blocks.spins import Spins
 from pyrodash.blocks.monopole import Monopole
 
 
+# Per-cell constants built once at import: the up-tetrahedra centers of
+# the origin cell and the [111]/4 offset of the down centers.
+_UP_CENTER_TEMPLATE = 0.5 * np.array([[0, 0, 0], [1, 1, 0], [0, 1, 1], [1, 0, 1]])
+_DOWN_OFFSET = np.array([1, 1, 1]) / 4
+
+
+@functools.lru_cache(maxsize=8)
+def _load_down_neighbors(L):
+    """Memory-maps the down-tetrahedra neighbor table for a lattice size.
+
+    The binary tables (see down_neighbors/convert_dat_to_npy.py) are
+    positioned by spin index // 4, so a tetrahedron's neighbors are a
+    direct row read; the map is shared by every cell of the lattice.
+    """
+
+    return np.load(
+        Path(__file__).resolve().parent / "down_neighbors" / f"L{L}.npy",
+        mmap_mode="r",
+    )
+
+
 class UnitCell:
     """
     Class to build a unit cell of the system. The lattice constant is
@@ -34,12 +56,20 @@ class UnitCell:
         cubes for the up and down tetrahedra.
     spins : list of Spins object
         contains instances of the Spins class for the cell spins.
+    spin_positions : numpy array
+        (16, 3) array with the positions of all the cell spins.
+    monopole_centers : numpy array
+        (8, 3) array with the centers of all the cell monopoles, up
+        tetrahedra first.
+    monopole_charges : numpy array of int
+        (8,) array with the charges of all the cell monopoles, up
+        tetrahedra first.
     monopoles_up, monopoles_down : list of Monopole object
-        contains instances of the Monopole class for the cell monopoles of 
+        contains instances of the Monopole class for the cell monopoles of
         the up and down tetrahedra
     """
 
-    def __init__(self, ijk, spin_values):
+    def __init__(self, ijk, spin_values, mesh_size=20):
         """
         Parameters
         ----------
@@ -47,14 +77,15 @@ class UnitCell:
             position of the cell in lattice parameter units.
         spin_values : numpy array of int
             array with the values of all the spins of the system.
+        mesh_size : integer, optional
+            size `n` of the `n x n` mesh generated to calculate the
+            coordinates of the spin surfaces, by default 20.
         """
 
-        self.ijk = np.array(ijk)
+        self.ijk = np.asarray(ijk, dtype=np.int64)
 
-        self.up_centers = (
-            0.5 * np.array([[0, 0, 0], [1, 1, 0], [0, 1, 1], [1, 0, 1]]) + self.ijk
-        )
-        self.down_centers = self.up_centers + np.array([1, 1, 1]) / 4
+        self.up_centers = _UP_CENTER_TEMPLATE + self.ijk
+        self.down_centers = self.up_centers + _DOWN_OFFSET
 
         _L = round((len(spin_values) / 16) ** (1 / 3))
         self.initial_spin = (
@@ -65,8 +96,19 @@ class UnitCell:
         # Cube
         self.cube = Parallelepiped(1., self.ijk)
 
-        # Tetrahedra
-        self.tetrahedra = [Tetrahedra(center, init_count=i) for center,i in zip(self.up_centers, range(1, 17, 4))]
+        # Tetrahedra; all the up vertices come from one broadcast and
+        # the slices are reused by the tetrahedra and the spins, so the
+        # vertex math is paid once per cell.
+        _all_up_vertices = (
+            self.up_centers[:, None, :] + 0.25 * Tetrahedra.base_vertices
+        )
+
+        self.tetrahedra = [
+            Tetrahedra(center, init_count=i, precomputed_vertices=vertices)
+            for center, i, vertices in zip(
+                self.up_centers, range(1, 17, 4), _all_up_vertices
+            )
+        ]
 
         # Individual cubes
         self.up_cubes = [
@@ -79,28 +121,36 @@ class UnitCell:
 
         # Spins
         self.spins = [
-            Spins(t.up_vertices, self.spin_values[i : i + 4])
-            for t, i in zip(self.tetrahedra, range(0, 16, 4))
+            Spins(vertices, self.spin_values[i : i + 4], mesh_size)
+            for vertices, i in zip(_all_up_vertices, range(0, 16, 4))
         ]
 
+        self.spin_positions = _all_up_vertices.reshape(16, 3)
+
         # Monopoles Up
+        _up_charges = -self.spin_values.reshape(4, 4).sum(axis=1)
+
         self.monopoles_up = [
-            Monopole(-int(sum(self.spin_values[i : i + 4])), center)
-            for i, center in zip(range(0, 16, 4), self.up_centers)
+            Monopole(int(charge), center)
+            for charge, center in zip(_up_charges, self.up_centers)
         ]
 
-        # Monopoles Down
-        _data_file = Path(__file__).resolve().parent / "down_neighbors" / f"L{_L}.dat"
+        # Monopoles Down; one gather of the (4, 4) tetrahedron/neighbor
+        # index matrix and one reduction instead of a Python loop.
+        _down_indices = np.arange(0, 16, 4)
 
-        _down_neighbors = pd.read_csv(
-            _data_file, sep=r"\s+", header=None, index_col=0, dtype=np.int
+        _idx_matrix = np.column_stack(
+            (_down_indices, _load_down_neighbors(_L)[_down_indices // 4])
         )
 
-        self.monopoles_down = []
-        for center, i in zip(self.down_centers, range(0, 16, 4)):
+        _down_charges = spin_values[_idx_matrix].sum(axis=1)
 
-            spines_down = np.insert(_down_neighbors.loc[i].values, 0, i)
+        self.monopoles_down = [
+            Monopole(int(charge), center)
+            for charge, center in zip(_down_charges, self.down_centers)
+        ]
 
-            self.monopoles_down.append(
-                Monopole(int(sum(spin_values[spines_down])), center)
-            )
+        # Structure-of-arrays views of the monopoles, for consumers that
+        # batch over all of them instead of iterating the objects.
+        self.monopole_centers = np.concatenate((self.up_centers, self.down_centers))
+        self.monopole_charges = np.concatenate((_up_charges, _down_charges))
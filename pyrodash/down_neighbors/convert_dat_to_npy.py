@@ -0,0 +1,27 @@
+"""One-off converter of the down_neighbors tables to binary lookups.
+
+    Each L{_L}.dat row holds a down-tetrahedron spin index (a multiple
+    of 4) followed by its three neighbor indices. The rows are scattered
+    into an array positioned by index // 4, saved as L{_L}.npy, which
+    UnitCell memory-maps instead of parsing the text file. Rows missing
+    from the .dat file are filled with -1.
+
+    Run it once from anywhere; it converts every .dat next to it.
+"""
+
+import numpy as np
+from pathlib import Path
+
+
+if __name__ == "__main__":
+
+    for dat in sorted(Path(__file__).resolve().parent.glob("L*.dat")):
+
+        table = np.atleast_2d(np.loadtxt(dat, dtype=np.int64))
+
+        lut = np.full((table[:, 0].max() // 4 + 1, 3), -1, dtype=np.int64)
+        lut[table[:, 0] // 4] = table[:, 1:]
+
+        np.save(dat.with_suffix(".npy"), lut)
+
+        print(f"{dat.name} -> {dat.with_suffix('.npy').name} {lut.shape}")
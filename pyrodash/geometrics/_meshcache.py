@@ -0,0 +1,75 @@
+"""Cached trigonometric tables for the parametric surfaces.
+
+    Every surface of a given mesh size parametrizes the same angles, so
+    the sin/cos tables are computed once per size and shared by all
+    instances. The returned arrays are shared and marked read-only.
+"""
+
+import functools
+
+import numpy as np
+
+
+@functools.lru_cache(maxsize=16)
+def angle_tables(mesh_size):
+    """(sin, cos) tables of `mesh_size` angles over [0, 2*pi].
+
+    Parameters
+    ----------
+    mesh_size : integer
+        number of angles of the tables.
+
+    Returns
+    -------
+    sin_theta, cos_theta : numpy array
+        sin and cos of the angles.
+    """
+
+    theta = np.linspace(0, 2 * np.pi, mesh_size)
+
+    sin_theta, cos_theta = np.sin(theta), np.cos(theta)
+
+    # Shared by every surface of this mesh size; read-only flags keep
+    # an in-place edit from corrupting the cache.
+    sin_theta.flags.writeable = False
+    cos_theta.flags.writeable = False
+
+    return sin_theta, cos_theta
+
+
+@functools.lru_cache(maxsize=16)
+def sphere_tables(mesh_size):
+    """Unit-sphere direction tables for an `n x n` theta/phi grid.
+
+    A sphere of any center and radius is then one multiply-add per
+    coordinate over these grids.
+
+    Parameters
+    ----------
+    mesh_size : integer
+        size `n` of the `n x n` grid.
+
+    Returns
+    -------
+    sin_t_cos_p, sin_t_sin_p, cos_t : numpy array
+        (n, n) grids of sin(theta)*cos(phi), sin(theta)*sin(phi) and
+        cos(theta).
+    """
+
+    theta = np.linspace(0, np.pi, mesh_size)
+    sin_phi, cos_phi = angle_tables(mesh_size)
+
+    # theta along columns, phi along rows, as the meshgrid version
+    # produced.
+    sin_theta, cos_theta = np.sin(theta), np.cos(theta)
+
+    tables = (
+        sin_theta * cos_phi[:, None],
+        sin_theta * sin_phi[:, None],
+        np.broadcast_to(cos_theta, (mesh_size, mesh_size)),
+    )
+
+    for table in tables[:2]:
+        table.flags.writeable = False
+
+    return tables
@@ -1,6 +1,10 @@
+import math
+from functools import cached_property
+
 import numpy as np
 import plotly.graph_objects as go
 
+from pyrodash.geometrics._meshcache import angle_tables
 import pyrodash.utils.linalg as linalg
 
 
@@ -20,8 +24,9 @@ class Circle:
         unit vector of the circle axis.
     x, y, z : numpy array
         coordinates of the circle edge.
-    scatter : list with a plotly go
-        scatter 3d plotly object of a filled circle.
+    mesh : plotly go
+        mesh 3d plotly object of a filled circle, built lazily on first
+        access.
     """
 
     def __init__(
@@ -32,6 +37,7 @@ class Circle:
         n1=np.array([0, 0, 0]),
         n2=np.array([0, 0, 0]),
         color="#636efa",
+        trig=None,
     ):
         """
         Parameters
@@ -43,25 +49,37 @@ class Circle:
         axis : list of float or numpy array
             unit vector of the circle axis.
         n1, n2 : numpy array, optional
-            coplanar vectors orthogonal to the axis, by default 
+            coplanar vectors orthogonal to the axis, by default
             np.array([0, 0, 0]).
         color : str, optional
             rgb, rgba, hex, hsl, hsv, or named color string for the
             surface color, by default "#636efa".
+        trig : tuple of numpy array, optional
+            precomputed (sin, cos) tables of angles over [0, 2*pi], to
+            share between surfaces with the same mesh, by default None
+            (computed locally).
         """
 
-        self.center = np.array(center)
+        self.center = np.asarray(center, dtype=np.float64)
         self.radius = radius
 
-        self.axis = np.array(axis) / np.linalg.norm(axis)
+        axis = np.asarray(axis, dtype=np.float64)
+        self.axis = axis / math.sqrt(axis @ axis)
 
         if np.all(n1 == 0) or np.all(n2 == 0):
-            n1, n2 = linalg.perpendicular_plane_vectors(self.axis)
+            n1, n2 = linalg.cached_perpendicular_plane_vectors(self.axis)
+
+        self.x, self.y, self.z = self._coordinates_calculation(n1, n2, trig)
+        self._color = color
+
+    @cached_property
+    def mesh(self):
+        """plotly go: mesh 3d plotly object of the filled circle, built
+        on first access and cached."""
 
-        self.x, self.y, self.z = self._coordinates_calculation(n1, n2)
-        self.scatter = self._draw_circle(color)
+        return self._draw_circle(self._color)
 
-    def _coordinates_calculation(self, n1, n2):
+    def _coordinates_calculation(self, n1, n2, trig=None):
         """Calculates the cartesian coordinates of the circle edge.
 
         It calculates the coordinates of the circle edge contained in the
@@ -71,6 +89,9 @@ class Circle:
         ----------
         n1, n2 : numpy array
             coplanar vectors orthogonal to the circle axis.
+        trig : tuple of numpy array, optional
+            precomputed (sin, cos) tables of the edge angles, by
+            default None (computed locally).
 
         Returns
         -------
@@ -78,22 +99,25 @@ class Circle:
             coordinates of the circle edge.
         """
 
-        theta = np.linspace(0, 2 * np.pi, 50)
+        if trig is None:
+            trig = angle_tables(50)
+        sin_theta, cos_theta = trig
 
-        x, y, z = [
-            self.center[i]
-            + self.radius * np.cos(theta) * n1[i]
-            + self.radius * np.sin(theta) * n2[i]
-            for i in [0, 1, 2]
-        ]
+        # One (3, n) outer-product combination of the direction vectors
+        # with the cached trig tables, instead of a Python loop over the
+        # components.
+        xyz = self.center[:, None] + self.radius * (
+            np.outer(n1, cos_theta) + np.outer(n2, sin_theta)
+        )
 
-        return x, y, z
+        return xyz[0], xyz[1], xyz[2]
 
     def _draw_circle(self, color):
-        """Generates the plotly scatter 3d object of a filled circle.
-        
-        It uses the calculated coordinates to draw the edges, and then 
-        fills it.
+        """Generates the plotly mesh 3d object of a filled circle.
+
+        It fan-triangulates the disc from the center, so the circle is
+        rendered by the same mesh pipeline as the rest of the surfaces
+        instead of a scatter trace with a surface fill.
 
         Parameters
         ----------
@@ -103,22 +127,23 @@ class Circle:
 
         Returns
         -------
-        list of a plotly go
-            scatter 3d plotly object of a filled circle.
+        plotly go
+            mesh 3d plotly object of a filled circle.
         """
 
-        return [
-            go.Scatter3d(
-                x=self.x,
-                y=self.y,
-                z=self.z,
-                mode="lines",
-                line_color=color,
-                surfaceaxis=2,
-                hoverinfo="none",
-                showlegend=False,
-            )
-        ]
+        n = len(self.x)
+
+        return go.Mesh3d(
+            x=np.concatenate(([self.center[0]], self.x)).astype(np.float32),
+            y=np.concatenate(([self.center[1]], self.y)).astype(np.float32),
+            z=np.concatenate(([self.center[2]], self.z)).astype(np.float32),
+            i=np.zeros(n - 1, dtype=np.int32),
+            j=np.arange(1, n, dtype=np.int32),
+            k=np.arange(2, n + 1, dtype=np.int32),
+            facecolor=[color] * (n - 1),
+            hoverinfo="none",
+            showlegend=False,
+        )
 
 
 if __name__ == "__main__":
@@ -130,8 +155,8 @@ if __name__ == "__main__":
     import plotly.graph_objects as go
 
     c = Circle([2, 5, 7], 2, [1, 1, 1])
-    
-    fig = go.Figure(data=c.scatter)
+
+    fig = go.Figure(data=[c.mesh])
 
     external_stylesheets = ["https://codepen.io/chriddyp/pen/bWLwgP.css"]
 
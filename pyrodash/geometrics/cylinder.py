@@ -1,6 +1,9 @@
+import math
+
 import numpy as np
 
 from pyrodash.geometrics.surface import Surface
+from pyrodash.geometrics._meshcache import angle_tables
 import pyrodash.utils.linalg as linalg
 
 
@@ -28,10 +31,13 @@ class Cylinder(Surface):
         x, y, z coordinates of the center of the top.
     x, y, z : numpy array
         coordinates of the surface of the cylinder.
-    surface : list of a plotly go
-        surface plotly object of the drawn cylinder.
+    surface : plotly go
+        surface plotly object of the drawn cylinder, built lazily on
+        first access.
     """
 
+    __slots__ = ("center", "radius", "length", "axis", "base_center", "top_center")
+
     def __init__(
         self,
         center,
@@ -42,6 +48,7 @@ class Cylinder(Surface):
         n2=np.array([0, 0, 0]),
         surface_color="#636efa",
         mesh_size=50,
+        trig=None,
     ):
         """
         Parameters
@@ -55,7 +62,7 @@ class Cylinder(Surface):
         axis : list of float or numpy array
             vector of the cylinder axis.
         n1, n2 : numpy array, optional
-            coplanar vectors orthogonal to the axis, by default 
+            coplanar vectors orthogonal to the axis, by default
             np.array([0, 0, 0]).
         surface_color : str, optional
             rgb, rgba, hex, hsl, hsv, or named color string for the
@@ -63,24 +70,30 @@ class Cylinder(Surface):
         mesh_size : integer, optional
             size `n` of the `n x n` mesh generated to calculate the
             coordinates of the surface, by default 50.
+        trig : tuple of numpy array, optional
+            precomputed (sin, cos) tables of `mesh_size` angles over
+            [0, 2*pi], to share between surfaces with the same mesh, by
+            default None (computed locally).
         """
 
-        self.center = np.array(center)
+        self.center = np.asarray(center, dtype=np.float64)
         self.radius = radius
 
         self.length = length
-        self.axis = np.array(axis) / np.linalg.norm(axis)
+        axis = np.asarray(axis, dtype=np.float64)
+        self.axis = axis / math.sqrt(axis @ axis)
 
         self.base_center = self.center - self.length / 2 * self.axis
         self.top_center = self.center + self.length / 2 * self.axis
 
         if np.all(n1 == 0) or np.all(n2 == 0):
-            n1, n2 = linalg.perpendicular_plane_vectors(self.axis)
+            n1, n2 = linalg.cached_perpendicular_plane_vectors(self.axis)
 
-        self.x, self.y, self.z = self._coordinates_calculation(n1, n2, mesh_size)
-        self.surface = self._draw_surface(surface_color)
+        self._xyz = self._coordinates_calculation(n1, n2, mesh_size, trig)
+        self.x, self.y, self.z = self._xyz
+        self._surface_color = surface_color
 
-    def _coordinates_calculation(self, n1, n2, mesh_size):
+    def _coordinates_calculation(self, n1, n2, mesh_size, trig=None):
         """Calculates the cartesian coordinates of the surface of the
         cylinder.
 
@@ -93,26 +106,39 @@ class Cylinder(Surface):
         mesh_size : integer
             size `n` of the `n x n` mesh generated to calculate the
             coordinates of the surface.
+        trig : tuple of numpy array, optional
+            precomputed (sin, cos) tables of the mesh angles, by
+            default None (computed locally).
 
         Returns
         -------
-        x, y, z : numpy array
-            coordinates of the surface of the cylinder.
+        xyz : numpy array
+            (3, n, n) contiguous block with the coordinates of the
+            surface of the cylinder.
         """
 
-        theta = np.linspace(0, 2 * np.pi, mesh_size)
-        t = np.linspace(0, 1, mesh_size)
-        theta, t = np.meshgrid(theta, t)
+        if trig is None:
+            trig = angle_tables(mesh_size)
+        sin_theta, cos_theta = trig
+
+        # The shared scalar grids are computed once and combined with
+        # the (3,) direction vectors in a single broadcast, producing
+        # the whole (3, n, n) coordinate block in one pass instead of a
+        # Python loop over the components.
+        t_length = self.length * np.linspace(0, 1, mesh_size)[:, None]
+        radial_sin = self.radius * sin_theta
+        radial_cos = self.radius * cos_theta
 
-        x, y, z = [
-            self.base_center[i]
-            + t * self.length * self.axis[i]
-            + self.radius * np.sin(theta) * n1[i]
-            + self.radius * np.cos(theta) * n2[i]
-            for i in [0, 1, 2]
-        ]
+        # float32 is all the renderer uses; casting at the source keeps
+        # the cached coordinate blocks at half size.
+        xyz = (
+            self.base_center[:, None, None]
+            + self.axis[:, None, None] * t_length
+            + n1[:, None, None] * radial_sin
+            + n2[:, None, None] * radial_cos
+        ).astype(np.float32)
 
-        return x, y, z
+        return xyz
 
 
 if __name__ == "__main__":
@@ -125,7 +151,7 @@ if __name__ == "__main__":
 
     c = Cylinder([2, 5, 7], 2, 10, [1, 1, 1], mesh_size=100)
 
-    fig = go.Figure(data=c.surface)
+    fig = go.Figure(data=[c.surface])
 
     external_stylesheets = ["https://codepen.io/chriddyp/pen/bWLwgP.css"]
 
@@ -1,8 +1,59 @@
+from functools import cached_property
+
 import numpy as np
-from itertools import product
 import plotly.graph_objects as go
 
 
+# The eight vertices of the unit cube in binary-counting order, scaled
+# by the side lengths to get any parallelepiped.
+_UNIT_CUBE = np.array(
+    [
+        [0, 0, 0],
+        [0, 0, 1],
+        [0, 1, 0],
+        [0, 1, 1],
+        [1, 0, 0],
+        [1, 0, 1],
+        [1, 1, 0],
+        [1, 1, 1],
+    ],
+    dtype=np.float64,
+)
+
+
+# The six ways of grabbing four points between the eight parallelepiped
+# vertices, one row per face.
+_FACE_IDX = np.array(
+    [
+        [2, 0, 1, 3],
+        [4, 6, 7, 5],
+        [6, 2, 3, 7],
+        [0, 4, 5, 1],
+        [0, 4, 6, 2],
+        [1, 5, 7, 3],
+    ],
+    dtype=np.intp,
+)
+
+# Each quad face split into two triangles, for the single face mesh.
+_TRI_IDX = np.concatenate((_FACE_IDX[:, [0, 1, 2]], _FACE_IDX[:, [0, 2, 3]]))
+
+# The twelve edges of the parallelepiped: vertex pairs differing in a
+# single bit of the binary-counting order.
+_EDGE_IDX = np.array(
+    [
+        [0, 1], [0, 2], [0, 4],
+        [1, 3], [1, 5],
+        [2, 3], [2, 6],
+        [3, 7],
+        [4, 5], [4, 6],
+        [5, 7],
+        [6, 7],
+    ],
+    dtype=np.intp,
+)
+
+
 class Parallelepiped:
     """
     Class to build and draw a Parallelepiped.
@@ -18,10 +69,10 @@ class Parallelepiped:
         x, y, z coordinates of the initial vertex position.
     vertices : numpy array
         vertices coordinates of the parallelepiped.
-    face_vertices : numpy array
-        vertices coordinates of each face.
     faces : list of plotly go
-        scatter 3d plotly objects of the parallelepiped faces.
+        scatter 3d plotly object of the parallelepiped edges, preceded
+        by the mesh 3d of its faces when they are not fully transparent,
+        built lazily on first access.
     """
 
     def __init__(
@@ -51,64 +102,35 @@ class Parallelepiped:
         """
 
         if isinstance(L, (list, np.ndarray)):
-            self.L = np.array(L)
+            self.L = np.asarray(L, dtype=np.float64)
         else:
             self.L = L
-        self.initial_vertex_position = np.array(initial_vertex_position)
+        self.initial_vertex_position = np.asarray(
+            initial_vertex_position, dtype=np.float64
+        )
 
-        if isinstance(self.L, np.ndarray):
-            self.vertices = self.initial_vertex_position + np.array(
-                list(product([0, self.L[0]], [0, self.L[1]], [0, self.L[2]]))
-            )
-        else:
-            self.vertices = self.initial_vertex_position + np.array(
-                list(product([0, self.L], [0, self.L], [0, self.L]))
-            )
+        # Scalar and per-side lengths both broadcast over the unit cube.
+        self.vertices = self.initial_vertex_position + _UNIT_CUBE * self.L
 
-        self.face_vertices = self._face_vertices_calculation()
+        self._edge_color = edge_color
+        self._edge_width = edge_width
+        self._face_opacity = face_opacity
 
-        self.faces = self._draw_faces(edge_color, edge_width, face_opacity)
+    @cached_property
+    def faces(self):
+        """list of plotly go: edges scatter, preceded by the faces mesh
+        when they are not fully transparent, built on first access and
+        cached."""
 
-    def _face_vertices_calculation(self):
-        """Calculates the vertices coordinates of each parallelepiped face.
-
-        Returns
-        -------
-        face_vertices : numpy array
-            vertices coordinates of each face.
-        """
-
-        face_vertices = []
-
-        # The six ways of grabbing four points between the eight
-        # parallelepiped vertices.
-        faces = [
-            (2, 0, 1, 3),
-            (4, 6, 7, 5),
-            (6, 2, 3, 7),
-            (0, 4, 5, 1),
-            (0, 4, 6, 2),
-            (1, 5, 7, 3),
-        ]
-
-        for face in faces:
-            # The x,y,z coordinates of each of the four face vertex.
-            vert_x = self.vertices[face, 0]
-            vert_y = self.vertices[face, 1]
-            vert_z = self.vertices[face, 2]
-
-            face_vertices.append(
-                [np.array(vert) for vert in zip(vert_x, vert_y, vert_z)]
-            )
-
-        return np.array(face_vertices)
+        return self._draw_faces(self._edge_color, self._edge_width, self._face_opacity)
 
     def _draw_faces(self, edge_color, edge_width, face_opacity):
-        """Generates the plotly scatter 3d for the parallelepiped faces.
+        """Generates the plotly objects for the parallelepiped faces.
 
-        It builds each face from the face vertices by generating two 
-        scatters: one to ensure the edges with the proper color and width, 
-        and the other one for the faces.
+        All twelve edges go into a single scatter with None separators
+        between the segments, and the faces into a single mesh of
+        twelve triangles, instead of two scatters per face. Fully
+        transparent faces (the default) skip the mesh entirely.
 
         Parameters
         ----------
@@ -123,39 +145,45 @@ class Parallelepiped:
         Returns
         -------
         faces : list of plotly go
-            scatter 3d plotly objects of the parallelepiped faces.
+            scatter 3d plotly object of the edges, preceded by the
+            mesh 3d of the faces when face_opacity is not zero.
         """
 
         faces = []
 
-        for i, vert in enumerate(self.face_vertices):
-
+        if face_opacity > 0:
             faces.append(
-                go.Scatter3d(
-                    x=vert[:, 0],
-                    y=vert[:, 1],
-                    z=vert[:, 2],
-                    mode="lines",
-                    line=dict(color=edge_color, width=edge_width),
+                go.Mesh3d(
+                    x=self.vertices[:, 0],
+                    y=self.vertices[:, 1],
+                    z=self.vertices[:, 2],
+                    i=_TRI_IDX[:, 0],
+                    j=_TRI_IDX[:, 1],
+                    k=_TRI_IDX[:, 2],
+                    facecolor=[f"rgba(128, 128, 128, {face_opacity})"] * 12,
                     hoverinfo="none",
-                    showlegend=False,
+                    showscale=False,
                 )
             )
 
-            faces.append(
-                go.Scatter3d(
-                    x=vert[:, 0],
-                    y=vert[:, 1],
-                    z=vert[:, 2],
-                    mode="lines",
-                    line=dict(color="gray", width=0),
-                    opacity=face_opacity,
-                    surfaceaxis=i // 2,
-                    surfacecolor="gray",
-                    hoverinfo="none",
-                    showlegend=False,
-                )
+        # (12, 2, 3) edge segments padded with a NaN row each, flattened
+        # so one scatter draws every edge.
+        segments = np.full((12, 3, 3), np.nan)
+        segments[:, :2] = self.vertices[_EDGE_IDX]
+        edge_x, edge_y, edge_z = segments.reshape(-1, 3).T
+
+        faces.append(
+            go.Scatter3d(
+                x=edge_x,
+                y=edge_y,
+                z=edge_z,
+                mode="lines",
+                line=dict(color=edge_color, width=edge_width),
+                connectgaps=False,
+                hoverinfo="none",
+                showlegend=False,
             )
+        )
 
         return faces
 
@@ -1,6 +1,7 @@
 import numpy as np
 
 from pyrodash.geometrics.surface import Surface
+from pyrodash.geometrics._meshcache import sphere_tables
 
 
 class Sphere(Surface):
@@ -19,10 +20,13 @@ class Sphere(Surface):
         radius of the sphere.
     x, y, z : numpy array
         coordinates of the surface of the sphere.
-    surface : list of a plotly go
-        surface plotly object of the drawn sphere.
+    surface : plotly go
+        surface plotly object of the drawn sphere, built lazily on
+        first access.
     """
 
+    __slots__ = ("center", "radius")
+
     def __init__(self, center, radius, surface_color="#636efa", mesh_size=50):
         """
         Parameters
@@ -39,11 +43,12 @@ class Sphere(Surface):
             coordinates of the surface, by default 50.
         """
 
-        self.center = np.array(center)
+        self.center = np.asarray(center, dtype=np.float64)
         self.radius = radius
 
-        self.x, self.y, self.z = self._coordinates_calculation(mesh_size)
-        self.surface = self._draw_surface(surface_color)
+        self._xyz = self._coordinates_calculation(mesh_size)
+        self.x, self.y, self.z = self._xyz
+        self._surface_color = surface_color
 
     def _coordinates_calculation(self, mesh_size):
         """Calculates the cartesian coordinates of the surface of the
@@ -59,19 +64,21 @@ class Sphere(Surface):
 
         Returns
         -------
-        x, y, z : numpy array
-            coordinates of the surface of the sphere.
+        xyz : numpy array
+            (3, n, n) contiguous block with the coordinates of the
+            surface of the sphere.
         """
 
-        theta = np.linspace(0, np.pi, mesh_size)
-        phi = np.linspace(0, 2 * np.pi, mesh_size)
-        theta, phi = np.meshgrid(theta, phi)
+        sin_t_cos_p, sin_t_sin_p, cos_t = sphere_tables(mesh_size)
 
-        x = self.center[0] + self.radius * np.sin(theta) * np.cos(phi)
-        y = self.center[1] + self.radius * np.sin(theta) * np.sin(phi)
-        z = self.center[2] + self.radius * np.cos(theta)
+        # float32 is all the renderer uses; the components are written
+        # straight into one half-size contiguous block.
+        xyz = np.empty((3,) + cos_t.shape, dtype=np.float32)
+        xyz[0] = self.center[0] + self.radius * sin_t_cos_p
+        xyz[1] = self.center[1] + self.radius * sin_t_sin_p
+        xyz[2] = self.center[2] + self.radius * cos_t
 
-        return x, y, z
+        return xyz
 
 
 if __name__ == "__main__":
@@ -84,7 +91,7 @@ if __name__ == "__main__":
 
     s = Sphere([1, 1, 1], 0.5, mesh_size=100)
 
-    fig = go.Figure(data=s.surface)
+    fig = go.Figure(data=[s.surface])
 
     external_stylesheets = ["https://codepen.io/chriddyp/pen/bWLwgP.css"]
 
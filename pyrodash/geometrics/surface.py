@@ -1,8 +1,25 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
+
 import numpy as np
 import plotly.graph_objects as go
 
 
+# Constant style templates shared by every surface trace; plotly copies
+# them on validation, so building them once per module instead of once
+# per trace is safe.
+_CONTOURS = dict(x_highlight=False, y_highlight=False, z_highlight=False)
+_LIGHTING = dict(ambient=0.6, diffuse=0.9, specular=0.25, roughness=0.35)
+_LIGHTPOSITION = dict(x=-100, y=0, z=0)
+
+
+@lru_cache(maxsize=32)
+def _flat_colorscale(surface_color):
+    """Single-color colorscale for a surface, cached per color."""
+
+    return [[0, surface_color], [1, surface_color]]
+
+
 class Surface(ABC):
     """
     Abstract base class for plotly surfaces.
@@ -12,9 +29,10 @@ class Surface(ABC):
     Attributes
     ----------
     x, y, z : numpy array
-        coordinates of the surface.
-    surface : list of a plotly go
-        surface plotly object.
+        coordinates of the surface; zero-copy views into one contiguous
+        (3, n, n) block.
+    surface : plotly go
+        surface plotly object, built lazily on first access.
 
     Methods
     -------
@@ -25,6 +43,10 @@ class Surface(ABC):
         Generates the plotly surface object.
     """
 
+    # Slotted instances skip the per-object __dict__; the lazy surface
+    # is cached in its own slot instead of a cached_property.
+    __slots__ = ("x", "y", "z", "_xyz", "_surface_color", "_surface")
+
     @abstractmethod
     def __init__(
         self,
@@ -47,8 +69,25 @@ class Surface(ABC):
             coordinates of the surface, by default 50.
         """
 
-        self.x, self.y, self.z = self._coordinates_calculation(n1, n2, mesh_size)
-        self.surface = self._draw_surface(surface_color)
+        # One contiguous structure-of-arrays block, with the component
+        # attributes as zero-copy views into it.
+        self._xyz = self._coordinates_calculation(n1, n2, mesh_size)
+        self.x, self.y, self.z = self._xyz
+        self._surface_color = surface_color
+
+    @property
+    def surface(self):
+        """plotly go: surface plotly object.
+
+        Built on first access and cached in its slot, so callers that
+        only need the coordinates never pay the plotly validation cost.
+        """
+
+        try:
+            return self._surface
+        except AttributeError:
+            self._surface = self._draw_surface(self._surface_color)
+            return self._surface
 
     @abstractmethod
     def _coordinates_calculation(self, n1, n2, mesh_size):
@@ -69,8 +108,9 @@ class Surface(ABC):
 
         Returns
         -------
-        x, y, z : numpy array
-            coordinates of the surface.
+        xyz : numpy array
+            (3, n, n) contiguous block with the coordinates of the
+            surface.
         """
 
         pass
@@ -88,20 +128,22 @@ class Surface(ABC):
 
         Returns
         -------
-        list of a plotly go
+        plotly go
             surface plotly object.
         """
 
-        return [
-            go.Surface(
-                x=self.x,
-                y=self.y,
-                z=self.z,
-                colorscale=[[0, surface_color], [1, surface_color]],
-                hoverinfo="none",
-                showscale=False,
-                contours=dict(x_highlight=False, y_highlight=False, z_highlight=False),
-                lighting=dict(ambient=0.6, diffuse=0.9, specular=0.25, roughness=0.35),
-                lightposition=dict(x=-100, y=0, z=0),
-            )
-        ]
+        # The bare trace is returned instead of a one-element list, so
+        # composing a scene doesn't allocate a wrapper per surface.
+        return go.Surface(
+            # float32 halves the payload shipped to the browser and
+            # is more precision than the renderer uses anyway.
+            x=self.x.astype(np.float32, copy=False),
+            y=self.y.astype(np.float32, copy=False),
+            z=self.z.astype(np.float32, copy=False),
+            colorscale=_flat_colorscale(surface_color),
+            hoverinfo="none",
+            showscale=False,
+            contours=_CONTOURS,
+            lighting=_LIGHTING,
+            lightposition=_LIGHTPOSITION,
+        )
@@ -1,9 +1,14 @@
 """Linear algebra module
 
     It only contains a function to find a pair of coplanar vectors
-    orthogonal between them and with a given one.
+    orthogonal between them and with a given one, plus a memoized
+    variant for the few distinct axes of the lattice and a batched
+    variant vectorized over many axes at once.
 """
 
+import functools
+import math
+
 import numpy as np
 
 
@@ -28,13 +33,95 @@ def perpendicular_plane_vectors(vector):
         coplanar unit vectors orthogonal to the given vector.
     """
 
-    not_vector = np.array([1, 0, 0])
-    if (vector == not_vector).all():
-        not_vector = np.array([0, 1, 0])
+    v = vector
+
+    # The canonical axis along the smallest component of the vector is
+    # guaranteed non-parallel to it, unlike the old exact-equality
+    # check against [1, 0, 0], which silently produced a zero cross for
+    # vectors like [-1, 0, 0]. Crossing with that axis reduces to
+    # component picks and sign flips, written straight into a
+    # preallocated buffer.
+    ax = int(np.argmin(np.abs(v)))
+
+    n1 = np.empty(3)
+    if ax == 0:
+        n1[0], n1[1], n1[2] = 0.0, v[2], -v[1]
+    elif ax == 1:
+        n1[0], n1[1], n1[2] = -v[2], 0.0, v[0]
+    else:
+        n1[0], n1[1], n1[2] = v[1], -v[0], 0.0
+
+    n1 *= 1.0 / math.sqrt(n1[0] * n1[0] + n1[1] * n1[1] + n1[2] * n1[2])
+
+    n2 = np.empty(3)
+    n2[0] = v[1] * n1[2] - v[2] * n1[1]
+    n2[1] = v[2] * n1[0] - v[0] * n1[2]
+    n2[2] = v[0] * n1[1] - v[1] * n1[0]
+
+    return n1, n2
+
+
+def perpendicular_plane_vectors_batch(vectors):
+    """Vectorized perpendicular_plane_vectors over many axes at once.
+
+    One sweep of array operations over the whole (N, 3) block instead
+    of N Python-level calls, using the same smallest-component rule to
+    pick the per-row auxiliary axis.
+
+    Parameters
+    ----------
+    vectors : numpy array
+        (N, 3) array of given unit vectors.
+
+    Returns
+    -------
+    n1, n2 : numpy array
+        (N, 3) arrays of coplanar unit vectors orthogonal to each given
+        vector.
+    """
+
+    vectors = np.asarray(vectors, dtype=np.float64)
+
+    aux = np.zeros_like(vectors)
+    aux[np.arange(len(vectors)), np.argmin(np.abs(vectors), axis=1)] = 1.0
+
+    n1 = np.cross(vectors, aux)
+    n1 /= np.sqrt((n1 * n1).sum(axis=1, keepdims=True))
+
+    n2 = np.cross(vectors, n1)
+
+    return n1, n2
+
+
+def cached_perpendicular_plane_vectors(vector):
+    """Memoized version of perpendicular_plane_vectors.
+
+    The lattice only ever uses a handful of distinct axes (the four
+    [111]-type directions and their opposites), so the plane vectors
+    are cached keyed on the rounded axis components.
+
+    Parameters
+    ----------
+    vector : numpy array
+        given unit vector.
+
+    Returns
+    -------
+    n1, n2 : numpy array
+        coplanar unit vectors orthogonal to the given vector.
+    """
+
+    return _plane_vectors_from_key(tuple(np.round(vector, 8)))
+
+
+@functools.lru_cache(maxsize=64)
+def _plane_vectors_from_key(vector_key):
 
-    n1 = np.cross(vector, not_vector)
-    n1 = n1 / np.linalg.norm(n1)
+    n1, n2 = perpendicular_plane_vectors(np.array(vector_key))
 
-    n2 = np.cross(vector, n1)
+    # The cached arrays are shared by every caller; read-only flags
+    # keep an in-place edit from corrupting the cache.
+    n1.flags.writeable = False
+    n2.flags.writeable = False
 
     return n1, n2